@@ -62,7 +62,7 @@ fi
 echo ""
 echo -e "${YELLOW}Installing Python dependencies...${NC}"
 python3 -m pip install --quiet --upgrade pip
-python3 -m pip install --quiet aiohttp
+python3 -m pip install --quiet aiohttp orjson uvloop
 
 echo ""
 echo -e "${GREEN}✓ All dependencies installed!${NC}"
@@ -83,7 +83,7 @@ REM Install Python dependencies
 echo.
 echo [*] Installing Python dependencies...
 python -m pip install --quiet --upgrade pip
-python -m pip install --quiet aiohttp
+python -m pip install --quiet aiohttp orjson
 
 echo.
 echo [OK] All dependencies installed!
@@ -28,11 +28,15 @@ REQUIREMENTS:
     - Python 3.7+
     - ADB (Android Debug Bridge) in PATH
     - aiohttp (auto-installed on first run)
+    - uvloop (optional, faster event loop on Mac/Linux)
+    - orjson (optional, faster JSON encoding for log broadcasts)
 
 CONFIGURATION:
     - PORT: Change the server port (default 8765)
     - CONFIG_FILE: Device config stored at ~/.logcat-viewer/devices.json
     - SCAN_TIMEOUT: Network scan timeout per IP (default 0.5s)
+    - WS_COMPRESS: WebSocket compression, off by default (set LOGCAT_WS_COMPRESS=1
+      or open the UI with ?compress=1 when viewing over a slow remote link)
 
 API ENDPOINTS:
     GET  /           - Web UI
@@ -40,7 +44,7 @@ API ENDPOINTS:
     GET  /api/devices - List all devices (JSON)
     POST /api/devices/scan - Trigger network scan
 
-WEBSOCKET ACTIONS (send JSON):
+WEBSOCKET ACTIONS (send JSON as a text or binary frame):
     {action: 'scan'}                    - Scan network for devices
     {action: 'add_device', device_id}   - Add device by IP
     {action: 'connect', device_id}      - Connect to device
@@ -57,17 +61,22 @@ REPOSITORY: https://github.com/G3dar/logcat
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import os
 import re
+import signal
 import socket
 import subprocess
 import sys
+import time
 import webbrowser
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 # Auto-install aiohttp if missing
 try:
@@ -77,11 +86,39 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "aiohttp"])
     from aiohttp import web
 
+# Optional: uvloop's libuv-based event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Optional: orjson encodes straight to bytes, several times faster than json
+try:
+    import orjson
+    encode_json = orjson.dumps
+    decode_json = orjson.loads
+except ImportError:
+    orjson = None
+    decode_json = json.loads  # accepts str or bytes
+
+    def encode_json(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 # Configuration
 PORT = 8765
 HOST = "0.0.0.0"
 CONFIG_FILE = Path.home() / ".logcat-viewer" / "devices.json"
 SCAN_TIMEOUT = 0.5  # seconds per port check
+SCAN_CONCURRENCY = 64  # port checks in flight at once during a network scan
+LOG_BATCH_SIZE = 128  # flush right away (no interval wait) once this many lines are queued
+LOG_FLUSH_INTERVAL = 0.05  # seconds between periodic log flushes
+PARSE_WORKERS = 2  # worker processes that parse and encode log batches
+PARSE_INLINE_MAX = 100  # smaller batches are parsed on the event loop (cheaper than the IPC)
+DEVICE_UPDATE_INTERVAL = 0.5  # seconds between device stats broadcasts
+LOG_QUEUE_LIMIT = 5000  # raw lines waiting for the flusher before the oldest are dropped
+READ_CHUNK_SIZE = 65536  # bytes read from adb per await
+READ_BUFFER_LIMIT = 1024 * 1024  # adb output buffered before the pipe is paused
+WS_COMPRESS = os.environ.get('LOGCAT_WS_COMPRESS') == '1'  # per-message deflate (off: saves CPU on localhost)
 DEVICE_COLORS = [
     "#3b82f6",  # blue
     "#10b981",  # green
@@ -93,7 +130,9 @@ DEVICE_COLORS = [
     "#84cc16",  # lime
 ]
 
-# Regex for parsing logcat
+# Regex for parsing logcat (fallback for lines the fast splitter rejects)
+LOG_LEVELS = frozenset('VDIWEF')
+LEVEL_OFFSET = 31  # level column in "MM-DD HH:MM:SS.mmm  PID  TID L TAG"
 LOG_PATTERN = re.compile(
     r'^(\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+'
     r'(\d+)\s+(\d+)\s+'
@@ -102,8 +141,9 @@ LOG_PATTERN = re.compile(
     r'(.*)$'
 )
 
-UNITY_TAG_PATTERN = re.compile(r'\[([^\]]+)\]')
+UNITY_TAG_PATTERN = re.compile(r'\[(?!\d+hs?\s+\d+m)([^\]]+)\]')  # skips timecodes like "[12hs 3m]"
 COLOR_TAG_PATTERN = re.compile(r'<color=([^>]+)>([^<]*)</color>')
+INET_ADDR_PATTERN = re.compile(r'inet (\d{1,3}(?:\.\d{1,3}){3})')  # IPv4 in `ip addr` output
 
 
 @dataclass
@@ -117,11 +157,24 @@ class DeviceInfo:
     status: str = "offline"     # online, offline, connecting
     connection_type: str = "wifi"  # wifi or usb
     color: str = "#3b82f6"
-    stats: Dict = field(default_factory=lambda: {'E': 0, 'W': 0, 'I': 0, 'D': 0, 'V': 0, 'total': 0})
+    stats: Dict = field(default_factory=lambda: {'E': 0, 'W': 0, 'I': 0, 'D': 0, 'V': 0, 'F': 0, 'total': 0, 'dropped': 0})
     last_seen: Optional[str] = None
 
     def to_dict(self):
-        return asdict(self)
+        # Spelled out: asdict() deep-copies every field through reflection.
+        # Sharing stats is fine, the dict is only ever serialized.
+        return {
+            'id': self.id,
+            'ip': self.ip,
+            'port': self.port,
+            'name': self.name,
+            'nickname': self.nickname,
+            'status': self.status,
+            'connection_type': self.connection_type,
+            'color': self.color,
+            'stats': self.stats,
+            'last_seen': self.last_seen,
+        }
 
 
 class DeviceManager:
@@ -132,7 +185,22 @@ class DeviceManager:
         self.processes: Dict[str, asyncio.subprocess.Process] = {}
         self.tasks: Dict[str, asyncio.Task] = {}
         self.color_index = 0
-        self.clients: Set[web.WebSocketResponse] = set()
+        self.clients: List[web.WebSocketResponse] = []
+        self.log_queue: Optional[asyncio.Queue] = None  # (device_id, raw lines); created on startup
+        self.queued_lines = 0  # total raw lines in log_queue
+        self.flush_task: Optional[asyncio.Task] = None
+        self.parse_pool: Optional[ProcessPoolExecutor] = None
+        self.repeats: Dict[str, Tuple[tuple, int]] = {}  # parse_batch() dedup state
+        self.dirty_devices: Set[str] = set()  # stats changed since the last device_update_batch
+        self.device_update_task: Optional[asyncio.Task] = None
+        self.last_seen_cache: Tuple[int, str] = (0, '')  # (epoch second, its ISO string)
+
+    def now_iso(self) -> str:
+        """Current time for last_seen, formatted at most once per second"""
+        second = int(time.time())
+        if second != self.last_seen_cache[0]:
+            self.last_seen_cache = (second, datetime.now().isoformat(timespec='seconds'))
+        return self.last_seen_cache[1]
 
     def get_next_color(self) -> str:
         color = DEVICE_COLORS[self.color_index % len(DEVICE_COLORS)]
@@ -143,11 +211,104 @@ class DeviceManager:
         """Send message to all connected WebSocket clients"""
         if not self.clients:
             return
-        msg_str = json.dumps(message)
-        await asyncio.gather(
-            *[client.send_str(msg_str) for client in self.clients],
-            return_exceptions=True
-        )
+        # Encode once and send the same bytes to every client
+        await self.broadcast_payload(encode_json(message))
+
+    async def broadcast_payload(self, payload: bytes):
+        """Send an already-encoded JSON message to all connected clients"""
+        # Awaiting each send directly avoids a Task per client per message;
+        # send_bytes only suspends when a client's socket is backed up.
+        # self.clients is replaced rather than mutated, so this loop keeps
+        # iterating the snapshot it started with.
+        for client in self.clients:
+            try:
+                await client.send_bytes(payload)
+            except Exception:
+                self.remove_client(client)
+
+    def add_client(self, ws: web.WebSocketResponse):
+        """Start sending broadcasts to a browser connection"""
+        self.clients = self.clients + [ws]
+
+    def remove_client(self, ws: web.WebSocketResponse):
+        """Stop sending broadcasts to a browser connection (no-op if already gone)"""
+        self.clients = [client for client in self.clients if client is not ws]
+
+    async def flush_logs(self, batch: List[Tuple[str, bytes]]):
+        """Parse raw (device_id, line) pairs and broadcast them as a single batch"""
+        sources = {d.id: (d.nickname or d.name, d.color) for d in self.devices.values()}
+
+        # Parsing and JSON encoding of bursts run in worker processes so the
+        # event loop only shuffles bytes between adb and the WebSocket
+        # clients; a trickle of lines isn't worth the round trip
+        result = None
+        if self.parse_pool and len(batch) >= PARSE_INLINE_MAX:
+            try:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    self.parse_pool, parse_batch, batch, sources, self.repeats
+                )
+            except Exception as e:
+                # Broken, or can't start workers (e.g. fork failed): parse inline from now on
+                print(f"Parse pool failed, parsing inline: {e!r}")
+                pool, self.parse_pool = self.parse_pool, None
+                pool.shutdown(wait=False)
+        if result is None:
+            result = parse_batch(batch, sources, self.repeats)
+        payload, level_counts, self.repeats = result
+
+        # Merge per-device stats (every key of LOG_LEVELS is preallocated)
+        now = self.now_iso()
+        for device_id, counts in level_counts.items():
+            device = self.devices.get(device_id)
+            if not device:
+                continue
+            stats = device.stats
+            for level, count in counts.items():
+                stats[level] += count
+                stats['total'] += count
+            device.last_seen = now
+            self.mark_device_dirty(device_id)
+
+        if payload:
+            await self.broadcast_payload(payload)
+
+    def mark_device_dirty(self, device_id: str):
+        """Schedule a throttled stats update for a device"""
+        self.dirty_devices.add(device_id)
+        if not self.device_update_task:
+            self.device_update_task = asyncio.create_task(self.send_device_updates())
+
+    async def send_device_updates(self):
+        """Broadcast all devices with changed stats as one message, at most every DEVICE_UPDATE_INTERVAL"""
+        await asyncio.sleep(DEVICE_UPDATE_INTERVAL)
+        self.device_update_task = None
+        dirty, self.dirty_devices = self.dirty_devices, set()
+        devices = (self.devices.get(device_id) for device_id in dirty)
+        data = [device.to_dict() for device in devices if device]
+        if data:
+            await self.broadcast({'type': 'device_update_batch', 'data': data})
+
+    async def run_log_flusher(self):
+        """Drain the log queue in batches, one at a time to keep them in order"""
+        queue = self.log_queue
+        while True:
+            try:
+                # Sleep until lines arrive, then give a burst a moment to fill the batch
+                device_id, lines = await queue.get()
+                batch = [(device_id, line) for line in lines]
+                if len(batch) < LOG_BATCH_SIZE:
+                    await asyncio.sleep(LOG_FLUSH_INTERVAL)
+                while not queue.empty():
+                    device_id, lines = queue.get_nowait()
+                    batch.extend((device_id, line) for line in lines)
+                self.queued_lines -= len(batch)
+                await self.flush_logs(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Lose this batch, not every batch after it
+                print(f"Error flushing logs: {e}")
 
     async def add_device(self, device_id: str, name: str = "", connection_type: str = "wifi") -> DeviceInfo:
         """Add a new device to track"""
@@ -210,7 +371,7 @@ class DeviceManager:
 
             # Start logcat
             device.status = "online"
-            device.last_seen = datetime.now().isoformat()
+            device.last_seen = self.now_iso()
             await self.broadcast({'type': 'device_update', 'data': device.to_dict()})
 
             # Start logcat task
@@ -242,9 +403,10 @@ class DeviceManager:
             del self.processes[device_id]
 
         # Update status
-        if device_id in self.devices:
-            self.devices[device_id].status = "offline"
-            await self.broadcast({'type': 'device_update', 'data': self.devices[device_id].to_dict()})
+        device = self.devices.get(device_id)
+        if device:
+            device.status = "offline"
+            await self.broadcast({'type': 'device_update', 'data': device.to_dict()})
 
     async def get_device_name(self, device_id: str) -> str:
         """Get device model name via adb"""
@@ -270,30 +432,24 @@ class DeviceManager:
                 process = await asyncio.create_subprocess_exec(
                     'adb', '-s', device_id, 'logcat', '-s', 'Unity:V',
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.STDOUT
+                    stderr=asyncio.subprocess.STDOUT,
+                    limit=READ_BUFFER_LIMIT
                 )
 
                 self.processes[device_id] = process
 
+                # One await per chunk instead of per line; the partial line
+                # at the end of each chunk is carried over to the next read
+                tail = b''
                 while True:
-                    line = await process.stdout.readline()
-                    if not line:
+                    chunk = await process.stdout.read(READ_CHUNK_SIZE)
+                    if not chunk:
                         break
-
-                    line = line.decode('utf-8', errors='replace')
-                    parsed = parse_log_line(line)
-
-                    if parsed:
-                        parsed['device_id'] = device_id
-                        parsed['device_name'] = device.nickname or device.name
-                        parsed['device_color'] = device.color
-
-                        # Update device stats
-                        device.stats[parsed['level']] = device.stats.get(parsed['level'], 0) + 1
-                        device.stats['total'] += 1
-                        device.last_seen = datetime.now().isoformat()
-
-                        await self.broadcast({'type': 'log', 'data': parsed})
+                    lines = (tail + chunk).split(b'\n')
+                    tail = lines.pop()
+                    self.queue_lines(device, lines)
+                if tail:
+                    self.queue_lines(device, [tail])
 
                 print(f"Logcat ended for {device_id}, restarting in 2 seconds...")
                 device.status = "connecting"
@@ -309,6 +465,45 @@ class DeviceManager:
                 await self.broadcast({'type': 'device_update', 'data': device.to_dict()})
                 await asyncio.sleep(2)
 
+    def count_lines(self, device: DeviceInfo, lines: List[bytes]):
+        """Add raw lines to the device counters without parsing them"""
+        stats = device.stats
+        total = stats['total']
+        for line in lines:
+            level = peek_log_level(line)
+            if level:
+                stats[level] += 1
+                stats['total'] += 1
+        if stats['total'] != total:
+            device.last_seen = self.now_iso()
+
+    def queue_lines(self, device: DeviceInfo, lines: List[bytes]):
+        """Hand raw logcat lines to the log flusher, or just count them"""
+        # Nobody is watching: keep the device counters, skip parsing
+        if not self.clients:
+            self.count_lines(device, lines)
+            return
+
+        # Parsed in batches by run_log_flusher()
+        lines = [line for line in lines if line]
+        if not lines:
+            return
+        queue = self.log_queue
+        self.queued_lines += len(lines)
+
+        # Viewers can't keep up: drop the oldest lines rather than buffer without bound
+        while self.queued_lines > LOG_QUEUE_LIMIT and not queue.empty():
+            dropped_id, dropped = queue.get_nowait()
+            self.queued_lines -= len(dropped)
+            dropped_device = self.devices.get(dropped_id)
+            if dropped_device:
+                # Not delivered, but still counted
+                self.count_lines(dropped_device, dropped)
+                dropped_device.stats['dropped'] += len(dropped)
+                self.mark_device_dirty(dropped_id)
+
+        queue.put_nowait((device.id, lines))
+
     async def scan_network(self) -> list:
         """Scan local network for ADB devices"""
         local_ip = get_local_ip()
@@ -321,20 +516,13 @@ class DeviceManager:
         print(f"Scanning network {subnet}.0/24 for ADB devices...")
         await self.broadcast({'type': 'scan_status', 'data': {'status': 'scanning', 'subnet': subnet}})
 
-        # Scan in batches for better performance
+        # Cap the sockets open at once so the scan doesn't starve log streaming
+        sem = asyncio.Semaphore(SCAN_CONCURRENCY)
+
         async def check_host(ip):
-            try:
-                reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection(ip, 5555),
-                    timeout=SCAN_TIMEOUT
-                )
-                writer.close()
-                await writer.wait_closed()
-                return ip
-            except:
-                return None
+            async with sem:
+                return ip if await is_port_open(ip, 5555, SCAN_TIMEOUT) else None
 
-        # Scan all IPs in parallel
         tasks = [check_host(f"{subnet}.{i}") for i in range(1, 255)]
         results = await asyncio.gather(*tasks)
 
@@ -399,8 +587,7 @@ class DeviceManager:
             output = stdout.decode()
 
             # Parse IP from output
-            import re
-            match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', output)
+            match = INET_ADDR_PATTERN.search(output)
             if match:
                 ip = match.group(1)
                 return {'success': True, 'ip': ip, 'device_id': f"{ip}:5555"}
@@ -461,44 +648,95 @@ def get_local_ip() -> str:
         return ""
 
 
-def parse_log_line(line: str) -> Optional[dict]:
-    """Parse a logcat line into a structured object"""
-    line = line.strip()
-    if not line:
-        return None
-
-    match = LOG_PATTERN.match(line)
-    if not match:
+async def is_port_open(ip: str, port: int, timeout: float) -> bool:
+    """Try a TCP connect, giving up after `timeout` seconds"""
+    connect = asyncio.open_connection(ip, port)
+    try:
+        if hasattr(asyncio, 'timeout'):
+            # Python 3.11+: no wrapper task per probe, unlike wait_for
+            async with asyncio.timeout(timeout):
+                _, writer = await connect
+        else:
+            _, writer = await asyncio.wait_for(connect, timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    # A scan has no use for the close handshake, so don't wait for it
+    writer.close()
+    return True
+
+
+def detect_category(message: str) -> Optional[str]:
+    """Pick a message's category by keyword, highest priority first
+
+    Substring checks on one lowered copy are far cheaper than a
+    case-insensitive regex, and keep the priority when several keywords match.
+    """
+    msg_lower = message.lower()
+    if 'quantum' in msg_lower:
+        return 'quantum'
+    if 'vivox' in msg_lower:
+        return 'vivox'
+    if 'connection' in msg_lower or 'network' in msg_lower or 'http' in msg_lower:
+        return 'network'
+    if 'analytics' in msg_lower or 'firebase' in msg_lower:
+        return 'analytics'
+    if 'camera' in msg_lower or 'follower' in msg_lower:
+        return 'camera'
+    if 'player' in msg_lower or 'roy' in msg_lower:
+        return 'player'
+    return None
+
+
+def parse_log_line(line: str, _levels=LOG_LEVELS, _match=LOG_PATTERN.match,
+                   _find_tag=UNITY_TAG_PATTERN.search, _detect_category=detect_category,
+                   _strip_colors=COLOR_TAG_PATTERN.sub) -> Optional[dict]:
+    """Parse a logcat line into a structured object
+
+    The underscore defaults bind the patterns as locals for the per-line
+    hot path; callers only pass `line`.
+    """
+    # Lines arrive already split on '\n'; only a CRLF remainder needs removing
+    line = line.rstrip('\r\n')
+    # Blank lines, "--------- beginning of" markers and stack-trace
+    # continuations can never match LOG_PATTERN: reject them with a few
+    # index checks on the "MM-DD HH:MM:SS.mmm" prefix
+    if len(line) < 20 or line[2] != '-' or not line[5].isspace() or not line[:2].isdigit():
         return None
 
-    timestamp, pid, tid, level, tag, message = match.groups()
+    # Fast path: threadtime output is whitespace-separated columns
+    # "MM-DD HH:MM:SS.mmm PID TID L TAG: message", so split instead of
+    # running LOG_PATTERN on every line
+    parts = line.split(None, 5)
+    tag = sep = ''
+    if (len(parts) == 6 and parts[4] in _levels and len(parts[0]) == 5
+            and len(parts[1]) == 12 and parts[2].isdigit() and parts[3].isdigit()):
+        tag, sep, message = parts[5].partition(':')
+        # LOG_PATTERN's greedy (\S+)\s*: can pull colons into the tag
+        # ("Unity:Tag: msg", "Tag: : msg"); adb always puts a space after the
+        # tag's colon, so leave any line where it doesn't to the regex
+        if sep and (message[:1].strip() or message.lstrip()[:1] == ':'):
+            sep = ''
+        tag = tag.rstrip()
+
+    if sep and tag and ' ' not in tag and '\t' not in tag:
+        timestamp = f"{parts[0]} {parts[1]}"
+        level = parts[4]
+        message = message.lstrip()
+    else:
+        match = _match(line)
+        if not match:
+            return None
+        timestamp, pid, tid, level, tag, message = match.groups()
 
     # Extract Unity tag if present
-    unity_tag = None
-    tag_match = UNITY_TAG_PATTERN.search(message)
-    if tag_match:
-        potential_tag = tag_match.group(1)
-        if not re.match(r'\d+hs?\s+\d+m', potential_tag):
-            unity_tag = potential_tag
+    tag_match = _find_tag(message)
+    unity_tag = tag_match.group(1) if tag_match else None
 
     # Detect category
-    msg_lower = message.lower()
-    category = None
-    if 'quantum' in msg_lower:
-        category = 'quantum'
-    elif 'vivox' in msg_lower:
-        category = 'vivox'
-    elif 'connection' in msg_lower or 'network' in msg_lower or 'http' in msg_lower:
-        category = 'network'
-    elif 'analytics' in msg_lower or 'firebase' in msg_lower:
-        category = 'analytics'
-    elif 'camera' in msg_lower or 'follower' in msg_lower:
-        category = 'camera'
-    elif 'player' in msg_lower or 'roy' in msg_lower:
-        category = 'player'
-
-    # Clean Unity color tags for display
-    clean_message = COLOR_TAG_PATTERN.sub(r'\2', message)
+    category = _detect_category(message)
+
+    # Clean Unity color tags for display (most lines have none)
+    clean_message = _strip_colors(r'\2', message) if '<color=' in message else message
 
     return {
         'timestamp': timestamp,
@@ -510,30 +748,112 @@ def parse_log_line(line: str) -> Optional[dict]:
     }
 
 
+def peek_log_level(line: bytes) -> Optional[str]:
+    """Read the level of a raw logcat line without decoding or parsing it"""
+    if (len(line) > LEVEL_OFFSET + 1 and line[2] == 0x2d  # '-'
+            and line[LEVEL_OFFSET - 1] == 0x20 and line[LEVEL_OFFSET + 1] == 0x20):
+        level = chr(line[LEVEL_OFFSET])
+        if level in LOG_LEVELS:
+            return level
+
+    # Unusual column widths (e.g. 6-digit PIDs): fall back to the full parser
+    parsed = parse_log_line(line.decode('utf-8', errors='replace'))
+    return parsed['level'] if parsed else None
+
+
+def init_parse_worker():
+    """Ignore Ctrl+C in parse workers; the main process shuts them down"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def parse_batch(batch: List[Tuple[str, bytes]], sources: Dict[str, Tuple[str, str]],
+                repeats: Dict[str, Tuple[tuple, int]]) -> Tuple[Optional[bytes], Dict[str, Dict[str, int]], Dict[str, Tuple[tuple, int]]]:
+    """Parse raw (device_id, line) pairs into one encoded 'logs' message
+
+    Runs in the parse worker pool. `sources` maps device_id to the
+    (display name, color) stamped on each log. `repeats` maps device_id to
+    the (level, tag, message) of its last log and how many times in a row it
+    was seen; a log identical to the previous one from the same device only
+    bumps the `repeat` count of that entry, or is resent with `continued`
+    set and the new count when the entry went out in an earlier batch.
+    Returns the encoded message (None if nothing parsed), per-device level
+    counts for DeviceInfo.stats and the updated `repeats`.
+    """
+    logs = []
+    level_counts: Dict[str, Dict[str, int]] = {}
+    last_entries: Dict[str, dict] = {}  # device_id -> its latest entry in `logs`
+    for device_id, line in batch:
+        source = sources.get(device_id)
+        parsed = parse_log_line(line.decode('utf-8', errors='replace')) if source else None
+        if not parsed:
+            continue
+
+        counts = level_counts.setdefault(device_id, {})
+        counts[parsed['level']] = counts.get(parsed['level'], 0) + 1
+
+        key = (parsed['level'], parsed['tag'], parsed['message'])
+        previous = repeats.get(device_id)
+        if previous and previous[0] == key:
+            repeat = previous[1] + 1
+            repeats[device_id] = (key, repeat)
+            entry = last_entries.get(device_id)
+            if entry is None:
+                # The line went out in an earlier batch. Resend it whole, so a
+                # viewer that never got it (just connected, or cleared) can show it
+                entry = parsed
+                entry['device_id'] = device_id
+                entry['device_name'], entry['device_color'] = source
+                entry['continued'] = True
+                logs.append(entry)
+                last_entries[device_id] = entry
+            entry['repeat'] = repeat
+            continue
+
+        repeats[device_id] = (key, 1)
+        parsed['device_id'] = device_id
+        parsed['device_name'], parsed['device_color'] = source
+        logs.append(parsed)
+        last_entries[device_id] = parsed
+
+    payload = encode_json({'type': 'logs', 'data': logs}) if logs else None
+    return payload, level_counts, repeats
+
+
 # HTTP Handlers
 async def index_handler(request):
     """Serve the HTML page"""
-    return web.Response(text=HTML_PAGE, content_type='text/html')
+    headers = {'ETag': HTML_ETAG, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if request.headers.get('If-None-Match') == HTML_ETAG:
+        return web.Response(status=304, headers=headers)
+    body = HTML_BYTES
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        body = HTML_GZIP
+        headers['Content-Encoding'] = 'gzip'
+    return web.Response(body=body, content_type='text/html', charset='utf-8', headers=headers)
 
 
 async def websocket_handler(request):
     """Handle WebSocket connections"""
-    ws = web.WebSocketResponse()
+    # Deflate costs more CPU than it saves on localhost; remote viewers on a
+    # slow link can opt in with ?compress=1 (or LOGCAT_WS_COMPRESS=1)
+    compress = request.query.get('compress', '1' if WS_COMPRESS else '0') == '1'
+    ws = web.WebSocketResponse(compress=compress)
     await ws.prepare(request)
 
-    device_manager.clients.add(ws)
+    device_manager.add_client(ws)
     print(f"Client connected. Total: {len(device_manager.clients)}")
 
     # Send current device list
-    await ws.send_str(json.dumps({
+    await ws.send_bytes(encode_json({
         'type': 'device_list',
         'data': device_manager.get_all_devices()
     }))
 
     try:
         async for msg in ws:
-            if msg.type == web.WSMsgType.TEXT:
-                data = json.loads(msg.data)
+            # Binary frames skip aiohttp's UTF-8 decode; the JSON parser reads bytes directly
+            if msg.type in (web.WSMsgType.TEXT, web.WSMsgType.BINARY):
+                data = decode_json(msg.data)
                 action = data.get('action')
 
                 if action == 'scan':
@@ -557,17 +877,16 @@ async def websocket_handler(request):
                     if device_id:
                         await device_manager.remove_device(device_id)
                 elif action == 'set_nickname':
-                    device_id = data.get('device_id')
-                    nickname = data.get('nickname', '')
-                    if device_id and device_id in device_manager.devices:
-                        device_manager.devices[device_id].nickname = nickname
+                    device = device_manager.devices.get(data.get('device_id'))
+                    if device:
+                        device.nickname = data.get('nickname', '')
                         await device_manager.broadcast({
                             'type': 'device_update',
-                            'data': device_manager.devices[device_id].to_dict()
+                            'data': device.to_dict()
                         })
                 elif action == 'get_usb_devices':
                     usb_devices = await device_manager.get_usb_devices()
-                    await ws.send_str(json.dumps({
+                    await ws.send_bytes(encode_json({
                         'type': 'usb_devices',
                         'data': usb_devices
                     }))
@@ -575,25 +894,25 @@ async def websocket_handler(request):
                     device_id = data.get('device_id')
                     if device_id:
                         result = await device_manager.enable_wifi_adb(device_id)
-                        await ws.send_str(json.dumps({
+                        await ws.send_bytes(encode_json({
                             'type': 'wifi_enabled',
                             'data': result
                         }))
                 elif action == 'clear_stats':
-                    device_id = data.get('device_id')
-                    if device_id and device_id in device_manager.devices:
-                        device_manager.devices[device_id].stats = {
-                            'E': 0, 'W': 0, 'I': 0, 'D': 0, 'V': 0, 'total': 0
+                    device = device_manager.devices.get(data.get('device_id'))
+                    if device:
+                        device.stats = {
+                            'E': 0, 'W': 0, 'I': 0, 'D': 0, 'V': 0, 'F': 0, 'total': 0, 'dropped': 0
                         }
                         await device_manager.broadcast({
                             'type': 'device_update',
-                            'data': device_manager.devices[device_id].to_dict()
+                            'data': device.to_dict()
                         })
 
     except Exception as e:
         print(f"WebSocket error: {e}")
     finally:
-        device_manager.clients.discard(ws)
+        device_manager.remove_client(ws)
         print(f"Client disconnected. Total: {len(device_manager.clients)}")
 
     return ws
@@ -601,13 +920,13 @@ async def websocket_handler(request):
 
 async def api_devices_handler(request):
     """GET /api/devices - List all devices"""
-    return web.json_response(device_manager.get_all_devices())
+    return web.Response(body=encode_json(device_manager.get_all_devices()), content_type='application/json')
 
 
 async def api_scan_handler(request):
     """POST /api/devices/scan - Scan network"""
     devices = await device_manager.scan_network()
-    return web.json_response(devices)
+    return web.Response(body=encode_json(devices), content_type='application/json')
 
 
 # Embedded HTML/CSS/JS
@@ -639,13 +958,26 @@ HTML_PAGE = '''<!DOCTYPE html>
             overflow-y: auto;
         }
 
+        #log-content {
+            position: relative;
+        }
+
+        /* Rows are virtualized: fixed height, absolutely positioned */
         .log-line {
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            will-change: transform;
+            height: 26px;
+            box-sizing: border-box;
             border-bottom: 1px solid var(--border-color);
             padding: 4px 8px;
             font-size: 12px;
             display: flex;
             gap: 8px;
-            align-items: flex-start;
+            align-items: center;
+            white-space: nowrap;
         }
 
         .log-line:hover {
@@ -695,7 +1027,8 @@ HTML_PAGE = '''<!DOCTYPE html>
 
         .message {
             flex: 1;
-            word-break: break-word;
+            overflow: hidden;
+            text-overflow: ellipsis;
         }
 
         .message .highlight {
@@ -705,6 +1038,15 @@ HTML_PAGE = '''<!DOCTYPE html>
             border-radius: 2px;
         }
 
+        .repeat-badge {
+            font-size: 10px;
+            font-weight: bold;
+            padding: 2px 6px;
+            border-radius: 4px;
+            background: var(--bg-tertiary);
+            color: var(--text-secondary);
+        }
+
         .device-badge {
             font-size: 9px;
             font-weight: bold;
@@ -929,6 +1271,8 @@ HTML_PAGE = '''<!DOCTYPE html>
             <span class="text-[#3fb950]">Info: <strong id="stat-info">0</strong></span>
         </div>
         <div class="flex items-center gap-4 text-[#8b949e]">
+            <span id="stat-dropped" class="text-[#d29922]" style="display: none"
+                  title="Log lines dropped by the server because viewers fell behind">0 dropped</span>
             <span id="device-count">0 devices</span>
             <span><span id="logs-per-sec">0</span> logs/sec</span>
         </div>
@@ -940,17 +1284,60 @@ HTML_PAGE = '''<!DOCTYPE html>
     <script>
         // State
         let devices = {};
-        let logs = [];
+        let deviceCount = 0;  // Object.keys(devices).length, kept by updateDeviceCount
         let filteredLogs = [];
+        let pausedLogs = null;  // copy of filteredLogs the list shows while paused
         let isPaused = false;
         let ws = null;
         let reconnectTimer = null;
         let logsLastSecond = 0;
         let minLevel = 'I';
         let activeDevice = 'all';
+        let activeDeviceIndex = -1;  // interned activeDevice, -1 for all
         let searchTerm = '';
+        let searchRegex = null;  // highlight pattern, rebuilt only when searchTerm changes
+        let counts = { total: 0, E: 0, W: 0, I: 0 };  // running stats for filteredLogs
 
         const levelPriority = { V: 0, D: 1, I: 2, W: 3, E: 4 };
+        let minLevelPriority = levelPriority[minLevel];
+
+        // Ring buffer of the most recent MAX_LOGS logs (oldest at ringStart)
+        const MAX_LOGS = 10000;
+        const logRing = new Array(MAX_LOGS);
+        let ringStart = 0;
+        let ringSize = 0;
+        // Level and device columns of the ring, so refilter can skip most logs
+        // without touching the log objects
+        const ringLevels = new Uint8Array(MAX_LOGS);
+        const ringDevices = new Uint16Array(MAX_LOGS);
+        const deviceIndex = new Map();  // device_id -> small integer for ringDevices
+        let lastLogByDevice = {};  // device_id -> newest log, target of repeat updates
+        const textDecoder = new TextDecoder();
+
+        // Virtualized log list: only rows in (or near) the viewport exist in the DOM
+        const ROW_HEIGHT = 26;  // must match .log-line height
+        const OVERSCAN = 10;
+        const rowPool = [];
+        let followTail = false;
+        let stickToBottom = true;  // new logs scroll into view only while the user is at the bottom
+        let shiftedRows = 0;  // rows evicted from the top of filteredLogs since the last render
+
+        // UI work is coalesced into at most one animation frame, however
+        // fast logs arrive
+        let frameId = 0;
+        let renderDirty = false;
+        let statsDirty = false;
+        let filterDirty = false;
+
+        // Row skeleton cloned for every pool row; renderLogLine() only sets
+        // text and classes, so rendering never goes through the HTML parser
+        const ROW_TEMPLATE = document.createElement('div');
+        for (const cls of ['device-badge', 'timestamp', 'level-badge', 'tag', 'message', 'repeat-badge']) {
+            ROW_TEMPLATE.appendChild(document.createElement('span')).className = cls;
+        }
+        const ROW_CLASS = { E: 'log-line error', W: 'log-line warning' };
+        const LEVEL_CLASS = {};
+        for (const level of 'VDIWEF') LEVEL_CLASS[level] = `level-badge level-${level}`;
 
         // DOM elements
         const logOutput = document.getElementById('log-output');
@@ -959,11 +1346,19 @@ HTML_PAGE = '''<!DOCTYPE html>
         const deviceTabs = document.getElementById('device-tabs');
         const searchInput = document.getElementById('search-input');
         const modalContainer = document.getElementById('modal-container');
+        const statEls = {
+            total: document.getElementById('stat-total'),
+            E: document.getElementById('stat-errors'),
+            W: document.getElementById('stat-warnings'),
+            I: document.getElementById('stat-info'),
+        };
+        const shownCounts = {};  // what statEls currently display
 
         // Connect WebSocket
         function connect() {
             const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-            ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
+            ws = new WebSocket(`${protocol}//${window.location.host}/ws${window.location.search}`);
+            ws.binaryType = 'arraybuffer';  // broadcasts arrive as UTF-8 binary frames
 
             ws.onopen = () => {
                 console.log('WebSocket connected');
@@ -977,7 +1372,8 @@ HTML_PAGE = '''<!DOCTYPE html>
             ws.onerror = () => ws.close();
 
             ws.onmessage = (event) => {
-                const msg = JSON.parse(event.data);
+                const data = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data);
+                const msg = JSON.parse(data);
                 handleMessage(msg);
             };
         }
@@ -990,20 +1386,32 @@ HTML_PAGE = '''<!DOCTYPE html>
                     });
                     renderDeviceTabs();
                     updateDeviceCount();
+                    updateDropped();
                     break;
                 case 'device_added':
                 case 'device_update':
                     devices[msg.data.id] = msg.data;
                     renderDeviceTabs();
                     updateDeviceCount();
+                    updateDropped();
+                    break;
+                case 'device_update_batch':
+                    for (const device of msg.data) devices[device.id] = device;
+                    renderDeviceTabs();
+                    updateDropped();
                     break;
                 case 'device_removed':
                     delete devices[msg.data.id];
                     renderDeviceTabs();
                     updateDeviceCount();
+                    updateDropped();
                     break;
-                case 'log':
-                    handleLog(msg.data);
+                case 'logs':
+                    // Continued entries update the repeat count of an earlier line
+                    for (const log of msg.data) {
+                        if (log.continued) handleRepeat(log);
+                        else handleLog(log);
+                    }
                     break;
                 case 'scan_status':
                     if (msg.data.status === 'scanning') {
@@ -1031,122 +1439,368 @@ HTML_PAGE = '''<!DOCTYPE html>
             }
         }
 
+        function internDevice(deviceId) {
+            let index = deviceIndex.get(deviceId);
+            if (index === undefined) {
+                index = deviceIndex.size;
+                deviceIndex.set(deviceId, index);
+            }
+            return index;
+        }
+
+        function pushLog(log) {
+            let slot, evicted = null;
+            if (ringSize < MAX_LOGS) {
+                slot = (ringStart + ringSize) % MAX_LOGS;
+                ringSize++;
+            } else {
+                slot = ringStart;
+                evicted = logRing[slot];
+                ringStart = (ringStart + 1) % MAX_LOGS;
+            }
+            // Intern level and device once so filtering only compares integers.
+            // Levels without a priority (F) always pass the level filter
+            const priority = levelPriority[log.level];
+            log.lvl = priority === undefined ? 255 : priority;
+            log.deviceIdx = internDevice(log.device_id);
+            logRing[slot] = log;
+            ringLevels[slot] = log.lvl;
+            ringDevices[slot] = log.deviceIdx;
+            return evicted;
+        }
+
+        function clearLogs() {
+            logRing.fill(undefined);
+            lastLogByDevice = {};
+            ringStart = 0;
+            ringSize = 0;
+        }
+
         function handleLog(log) {
-            logs.push(log);
+            const evicted = pushLog(log);
+            lastLogByDevice[log.device_id] = log;
             logsLastSecond++;
 
-            if (logs.length > 10000) {
-                logs = logs.slice(-8000);
+            // filteredLogs is an ordered subset of the ring, so an evicted
+            // log can only ever be its first entry
+            if (evicted && filteredLogs[0] === evicted) {
+                filteredLogs.shift();
+                uncountLog(evicted);
+                if (!isPaused) {
+                    shiftedRows++;
+                    scheduleRender(false);
+                }
+            }
+            if (evicted && lastLogByDevice[evicted.device_id] === evicted) {
+                delete lastLogByDevice[evicted.device_id];
             }
 
             if (shouldShow(log)) {
                 filteredLogs.push(log);
-                if (!isPaused) {
-                    appendLogLine(log);
-                    scrollToBottom();
-                }
+                countLog(log);
+                if (!isPaused) scheduleRender(stickToBottom);
             }
 
-            updateStats();
+            scheduleStats();
             emptyState.style.display = 'none';
         }
 
+        // The server collapses consecutive identical lines from a device
+        // into a count on the first one
+        function handleRepeat(update) {
+            const log = lastLogByDevice[update.device_id];
+            if (!log || log.message !== update.message || log.tag !== update.tag) {
+                // This viewer doesn't have the line (connected or cleared since): show it as new
+                handleLog(update);
+                return;
+            }
+            const added = update.repeat - (log.repeat || 1);
+            log.repeat = update.repeat;
+            logsLastSecond += added;
+            if (shouldShow(log)) {
+                counts.total += added;
+                if (log.level in counts) counts[log.level] += added;
+                scheduleStats();
+            }
+            for (const row of rowPool) {
+                if (row.log === log) row.log = null;
+            }
+            if (!isPaused) scheduleRender(false);
+        }
+
         function shouldShow(log) {
-            if (levelPriority[log.level] < levelPriority[minLevel]) return false;
-            if (activeDevice !== 'all' && log.device_id !== activeDevice) return false;
-            if (searchTerm && !log.message.toLowerCase().includes(searchTerm) &&
-                !log.tag.toLowerCase().includes(searchTerm)) return false;
-            return true;
-        }
-
-        function appendLogLine(log) {
-            const div = document.createElement('div');
-            div.className = `log-line ${log.level === 'E' ? 'error' : ''} ${log.level === 'W' ? 'warning' : ''}`;
-
-            const categoryClass = log.category ? `category-${log.category}` : '';
-            let message = escapeHtml(log.message);
-            if (searchTerm) {
-                const regex = new RegExp(`(${escapeRegex(searchTerm)})`, 'gi');
-                message = message.replace(regex, '<span class="highlight">$1</span>');
+            if (log.lvl < minLevelPriority) return false;
+            if (activeDeviceIndex !== -1 && log.deviceIdx !== activeDeviceIndex) return false;
+            return !searchTerm || matchesSearch(log);
+        }
+
+        function matchesSearch(log) {
+            // Lowered copies are made once per log, the first time a search needs them
+            if (log._lm === undefined) {
+                log._lm = log.message.toLowerCase();
+                log._lt = log.tag.toLowerCase();
             }
+            return log._lm.indexOf(searchTerm) !== -1 || log._lt.indexOf(searchTerm) !== -1;
+        }
 
-            const showDeviceBadge = activeDevice === 'all' && Object.keys(devices).length > 1;
-            const deviceBadge = showDeviceBadge ?
-                `<span class="device-badge" style="background: ${log.device_color}">${getDeviceShortName(log.device_name)}</span>` : '';
+        function scheduleFrame() {
+            // While the tab is hidden the dirty flags just accumulate
+            if (!frameId && !document.hidden) frameId = requestAnimationFrame(flushFrame);
+        }
 
-            div.innerHTML = `
-                ${deviceBadge}
-                <span class="timestamp">${log.timestamp.split(' ')[1]}</span>
-                <span class="level-badge level-${log.level}">${log.level}</span>
-                <span class="tag ${categoryClass}">[${escapeHtml(log.tag)}]</span>
-                <span class="message">${message}</span>
-            `;
+        function scheduleRender(scrollToEnd) {
+            if (scrollToEnd) followTail = true;
+            renderDirty = true;
+            scheduleFrame();
+        }
 
-            logContent.appendChild(div);
+        function scheduleStats() {
+            statsDirty = true;
+            scheduleFrame();
         }
 
+        function scheduleRefilter() {
+            filterDirty = true;
+            scheduleFrame();
+        }
+
+        function flushFrame() {
+            if (filterDirty) {
+                // Runs while frameId is still set, so its render and stats land in this frame
+                filterDirty = false;
+                refilter();
+            }
+            frameId = 0;
+            if (renderDirty) {
+                renderDirty = false;
+                renderLogs();
+            }
+            if (statsDirty) {
+                statsDirty = false;
+                updateStats();
+            }
+        }
+
+        function renderLogs() {
+            logContent.style.height = `${(pausedLogs || filteredLogs).length * ROW_HEIGHT}px`;
+            if (shiftedRows) {
+                // Keep the rows a scrolled-up reader is looking at in place
+                if (!stickToBottom) logOutput.scrollTop -= shiftedRows * ROW_HEIGHT;
+                shiftedRows = 0;
+            }
+            if (followTail) {
+                followTail = false;
+                scrollToBottom();
+            }
+            renderVisibleRows();
+        }
+
+        function renderVisibleRows() {
+            const logs = pausedLogs || filteredLogs;
+            const total = logs.length;
+            const top = logOutput.scrollTop;
+            const first = Math.max(0, Math.floor(top / ROW_HEIGHT) - OVERSCAN);
+            const last = Math.min(total, Math.ceil((top + logOutput.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+
+            if (rowPool.length < last - first) {
+                // New rows go in with a single insertion
+                const fragment = document.createDocumentFragment();
+                while (rowPool.length < last - first) {
+                    rowPool.push(fragment.appendChild(createRow()));
+                }
+                logContent.appendChild(fragment);
+                invalidateRows();
+            }
+
+            // Each log index maps to a fixed pool slot, so rows that stay in
+            // view while scrolling or tailing keep their content untouched
+            const size = rowPool.length;
+            for (let slot = 0; slot < size; slot++) {
+                const row = rowPool[slot];
+                const index = first + (slot - first % size + size) % size;
+                if (index >= last) {
+                    row.style.display = 'none';
+                    row.log = null;
+                    continue;
+                }
+                const log = logs[index];
+                if (row.log !== log) {
+                    renderLogLine(row, log);
+                    row.log = log;
+                    row.style.display = '';
+                }
+                if (row.index !== index) {
+                    // A transform moves the row on the compositor, no relayout
+                    row.style.transform = `translateY(${index * ROW_HEIGHT}px)`;
+                    row.index = index;
+                }
+            }
+        }
+
+        function createRow() {
+            const row = ROW_TEMPLATE.cloneNode(true);
+            [row.deviceEl, row.timeEl, row.levelEl, row.tagEl, row.messageEl, row.repeatEl] = row.children;
+            return row;
+        }
+
+        function invalidateRows() {
+            for (const row of rowPool) row.log = null;
+        }
+
+        function renderLogLine(row, log) {
+            row.className = ROW_CLASS[log.level] || 'log-line';
+
+            const showDeviceBadge = activeDevice === 'all' && deviceCount > 1;
+            row.deviceEl.style.display = showDeviceBadge ? '' : 'none';
+            if (showDeviceBadge) {
+                row.deviceEl.style.background = log.device_color;
+                row.deviceEl.textContent = getDeviceShortName(log.device_name);
+            }
+
+            row.timeEl.textContent = log.timestamp.split(' ')[1];
+            row.levelEl.className = LEVEL_CLASS[log.level];
+            row.levelEl.textContent = log.level;
+            row.tagEl.className = log.category ? `tag category-${log.category}` : 'tag';
+            row.tagEl.textContent = `[${log.tag}]`;
+            if (searchRegex) {
+                row.messageEl.textContent = '';
+                row.messageEl.appendChild(highlightMatches(log.message));
+            } else {
+                row.messageEl.textContent = log.message;
+            }
+            row.repeatEl.style.display = log.repeat > 1 ? '' : 'none';
+            if (log.repeat > 1) row.repeatEl.textContent = `×${log.repeat}`;
+            row.title = log.message;
+        }
+
+        function highlightMatches(text) {
+            // split() with a capturing regex puts the matches at odd indices
+            const fragment = document.createDocumentFragment();
+            text.split(searchRegex).forEach((part, i) => {
+                if (i % 2) {
+                    const mark = fragment.appendChild(document.createElement('span'));
+                    mark.className = 'highlight';
+                    mark.textContent = part;
+                } else if (part) {
+                    fragment.appendChild(document.createTextNode(part));
+                }
+            });
+            return fragment;
+        }
+
+        const shortNames = new Map();  // device name -> badge text, derived once per name
+
         function getDeviceShortName(name) {
             if (!name) return '??';
-            const words = name.split(' ');
-            if (words.length >= 2) {
-                return words.map(w => w[0]).join('').substring(0, 3).toUpperCase();
+            let short = shortNames.get(name);
+            if (short === undefined) {
+                const words = name.split(' ');
+                short = words.length >= 2
+                    ? words.map(w => w[0]).join('').substring(0, 3).toUpperCase()
+                    : name.substring(0, 3).toUpperCase();
+                shortNames.set(name, short);
             }
-            return name.substring(0, 3).toUpperCase();
+            return short;
         }
 
         function scrollToBottom() {
+            stickToBottom = true;
             logOutput.scrollTop = logOutput.scrollHeight;
         }
 
-        function updateStats() {
-            let total = 0, errors = 0, warnings = 0, info = 0;
+        // A collapsed line counts once per repeat
+        function countLog(log) {
+            const n = log.repeat || 1;
+            counts.total += n;
+            if (log.level in counts) counts[log.level] += n;
+        }
 
-            for (const log of filteredLogs) {
-                total++;
-                if (log.level === 'E') errors++;
-                else if (log.level === 'W') warnings++;
-                else if (log.level === 'I') info++;
-            }
+        function uncountLog(log) {
+            const n = log.repeat || 1;
+            counts.total -= n;
+            if (log.level in counts) counts[log.level] -= n;
+        }
 
-            document.getElementById('stat-total').textContent = total;
-            document.getElementById('stat-errors').textContent = errors;
-            document.getElementById('stat-warnings').textContent = warnings;
-            document.getElementById('stat-info').textContent = info;
+        function resetCounts() {
+            counts = { total: 0, E: 0, W: 0, I: 0 };
+        }
+
+        function updateStats() {
+            // Only touch the counters that changed since the last frame
+            for (const key in statEls) {
+                if (shownCounts[key] !== counts[key]) {
+                    statEls[key].textContent = counts[key];
+                    shownCounts[key] = counts[key];
+                }
+            }
         }
 
         function updateDeviceCount() {
             const online = Object.values(devices).filter(d => d.status === 'online').length;
-            const total = Object.keys(devices).length;
+            deviceCount = Object.keys(devices).length;
             document.getElementById('device-count').textContent =
-                `${online}/${total} device${total !== 1 ? 's' : ''}`;
+                `${online}/${deviceCount} device${deviceCount !== 1 ? 's' : ''}`;
+        }
+
+        // Lines the server discarded because this viewer couldn't keep up
+        function updateDropped() {
+            const dropped = Object.values(devices).reduce((sum, d) => sum + (d.stats.dropped || 0), 0);
+            const el = document.getElementById('stat-dropped');
+            el.textContent = `${dropped} dropped`;
+            el.style.display = dropped ? '' : 'none';
         }
 
+        const tabEls = new Map();  // device_id -> tab button and the parts that change
+
+        function createDeviceTab(id) {
+            const btn = document.createElement('button');
+            btn.className = `tab-btn flex items-center gap-2 ${activeDevice === id ? 'active' : ''}`;
+            btn.dataset.device = id;
+            const dotEl = document.createElement('span');
+            const nameEl = document.createElement('span');
+            const errorsEl = document.createElement('span');
+            errorsEl.className = 'text-[#f85149] text-xs';
+            btn.append(dotEl, nameEl, errorsEl);
+            deviceTabs.appendChild(btn);
+            return { btn, dotEl, nameEl, errorsEl, status: null, name: null, errors: null };
+        }
+
+        // Only touches the tabs and fields that actually changed
         function renderDeviceTabs() {
-            deviceTabs.innerHTML = '';
+            for (const [id, tab] of tabEls) {
+                if (!(id in devices)) {
+                    tab.btn.remove();
+                    tabEls.delete(id);
+                }
+            }
 
             for (const [id, device] of Object.entries(devices)) {
-                const btn = document.createElement('button');
-                btn.className = `tab-btn flex items-center gap-2 ${activeDevice === id ? 'active' : ''}`;
-                btn.dataset.device = id;
-                btn.innerHTML = `
-                    <span class="status-dot ${device.status}"></span>
-                    <span>${device.nickname || device.name}</span>
-                    ${device.stats.E > 0 ? `<span class="text-[#f85149] text-xs">${device.stats.E}</span>` : ''}
-                `;
-                btn.onclick = () => selectDevice(id);
-
-                // Right-click for context menu
-                btn.oncontextmenu = (e) => {
-                    e.preventDefault();
-                    showDeviceMenu(id, e);
-                };
-
-                deviceTabs.appendChild(btn);
+                let tab = tabEls.get(id);
+                if (!tab) {
+                    tab = createDeviceTab(id);
+                    tabEls.set(id, tab);
+                }
+                if (tab.status !== device.status) {
+                    tab.status = device.status;
+                    tab.dotEl.className = `status-dot ${device.status}`;
+                }
+                const name = device.nickname || device.name;
+                if (tab.name !== name) {
+                    tab.name = name;
+                    tab.nameEl.textContent = name;
+                }
+                const errors = device.stats.E;
+                if (tab.errors !== errors) {
+                    tab.errors = errors;
+                    tab.errorsEl.textContent = errors;
+                    tab.errorsEl.style.display = errors > 0 ? '' : 'none';
+                }
             }
         }
 
         function selectDevice(deviceId) {
             activeDevice = deviceId;
+            activeDeviceIndex = deviceId === 'all' ? -1 : internDevice(deviceId);
 
             // Update tab buttons
             document.querySelectorAll('.tab-btn').forEach(btn => {
@@ -1157,11 +1811,24 @@ HTML_PAGE = '''<!DOCTYPE html>
         }
 
         function refilter() {
-            filteredLogs = logs.filter(shouldShow);
-            logContent.innerHTML = '';
-            filteredLogs.slice(-500).forEach(appendLogLine);
-            scrollToBottom();
-            updateStats();
+            filteredLogs = [];
+            shiftedRows = 0;
+            resetCounts();
+            // Index the ring directly and test the integer columns before the log itself
+            for (let i = 0; i < ringSize; i++) {
+                const slot = (ringStart + i) % MAX_LOGS;
+                if (ringLevels[slot] < minLevelPriority) continue;
+                if (activeDeviceIndex !== -1 && ringDevices[slot] !== activeDeviceIndex) continue;
+                const log = logRing[slot];
+                if (searchTerm && !matchesSearch(log)) continue;
+                filteredLogs.push(log);
+                countLog(log);
+            }
+            // A filter change while paused re-freezes the view with the new filter
+            if (pausedLogs) pausedLogs = filteredLogs.slice();
+            invalidateRows();
+            scheduleRender(true);
+            scheduleStats();
         }
 
         function showDeviceMenu(deviceId, event) {
@@ -1252,21 +1919,43 @@ HTML_PAGE = '''<!DOCTYPE html>
                 return;
             }
 
-            const content = `
+            const list = document.createElement('div');
+            list.className = 'space-y-2';
+            for (const d of foundDevices) {
+                let action;
+                if (d.known) {
+                    action = document.createElement('span');
+                    action.className = 'text-xs text-[#8b949e]';
+                    action.textContent = 'Already added';
+                } else {
+                    action = createModalButton('Add & Connect', () => addAndConnect(d.id));
+                }
+                list.appendChild(createDeviceRow(d.ip, action));
+            }
+            showModal('Scan Results', `
                 <p class="text-sm text-[#8b949e] mb-4">Found ${foundDevices.length} device(s) with port 5555 open:</p>
-                <div class="space-y-2">
-                    ${foundDevices.map(d => `
-                        <div class="flex items-center justify-between p-3 bg-[#21262d] rounded-lg">
-                            <span>${d.ip}</span>
-                            ${d.known ?
-                                '<span class="text-xs text-[#8b949e]">Already added</span>' :
-                                `<button onclick="addAndConnect('${d.id}')" class="filter-btn">Add & Connect</button>`
-                            }
-                        </div>
-                    `).join('')}
-                </div>
-            `;
-            showModal('Scan Results', content);
+                <div id="modal-device-list"></div>
+            `);
+            document.getElementById('modal-device-list').replaceWith(list);
+        }
+
+        // Device ids and addresses come from adb and the network, so modal
+        // rows set them as text and bind actions directly, never through markup
+        function createDeviceRow(label, action) {
+            const row = document.createElement('div');
+            row.className = 'flex items-center justify-between p-3 bg-[#21262d] rounded-lg';
+            const labelEl = document.createElement('span');
+            labelEl.textContent = label;
+            row.append(labelEl, action);
+            return row;
+        }
+
+        function createModalButton(text, onClick) {
+            const btn = document.createElement('button');
+            btn.className = 'filter-btn';
+            btn.textContent = text;
+            btn.addEventListener('click', onClick);
+            return btn;
         }
 
         function addAndConnect(deviceId) {
@@ -1286,19 +1975,17 @@ HTML_PAGE = '''<!DOCTYPE html>
                 return;
             }
 
-            const content = `
+            const list = document.createElement('div');
+            list.className = 'space-y-2';
+            for (const d of usbDevices) {
+                list.appendChild(createDeviceRow(d.id, createModalButton('Enable WiFi ADB', () => enableWifi(d.id))));
+            }
+            showModal('USB Setup', `
                 <p class="text-sm text-[#8b949e] mb-4">Enable WiFi ADB on these USB-connected devices:</p>
-                <div class="space-y-2">
-                    ${usbDevices.map(d => `
-                        <div class="flex items-center justify-between p-3 bg-[#21262d] rounded-lg">
-                            <span>${d.id}</span>
-                            <button onclick="enableWifi('${d.id}')" class="filter-btn">Enable WiFi ADB</button>
-                        </div>
-                    `).join('')}
-                </div>
+                <div id="modal-device-list"></div>
                 <p class="text-xs text-[#8b949e] mt-4">This will run "adb tcpip 5555" and auto-connect via WiFi.</p>
-            `;
-            showModal('USB Setup', content);
+            `);
+            document.getElementById('modal-device-list').replaceWith(list);
         }
 
         function enableWifi(deviceId) {
@@ -1330,12 +2017,6 @@ HTML_PAGE = '''<!DOCTYPE html>
             }
         }
 
-        function escapeHtml(str) {
-            const div = document.createElement('div');
-            div.textContent = str;
-            return div.innerHTML;
-        }
-
         function escapeRegex(str) {
             return str.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
         }
@@ -1352,22 +2033,40 @@ HTML_PAGE = '''<!DOCTYPE html>
         };
 
         document.getElementById('btn-clear').onclick = () => {
-            logs = [];
+            // Drop the frame queued for the old logs; the next one paints the empty list
+            cancelAnimationFrame(frameId);
+            frameId = 0;
+            clearLogs();
             filteredLogs = [];
-            logContent.innerHTML = '';
-            updateStats();
+            if (pausedLogs) pausedLogs = [];
+            shiftedRows = 0;
+            resetCounts();
+            scheduleRender(true);
+            scheduleStats();
         };
 
         document.getElementById('btn-pause').onclick = (e) => {
             isPaused = !isPaused;
             e.target.textContent = isPaused ? 'Resume' : 'Pause';
             e.target.classList.toggle('active', isPaused);
-            if (!isPaused) refilter();
+            // Scrolling while paused renders this copy, not the still-growing list
+            if (isPaused) {
+                pausedLogs = filteredLogs.slice();
+            } else {
+                pausedLogs = null;
+                refilter();
+            }
         };
 
         document.getElementById('btn-export').onclick = () => {
-            const text = filteredLogs.map(l => `[${l.device_name}] ${l.raw}`).join('\\n');
-            const blob = new Blob([text], { type: 'text/plain' });
+            // Blob joins the parts natively, without one giant intermediate string
+            const parts = [];
+            for (const l of pausedLogs || filteredLogs) {
+                parts.push('[', l.device_name, '] ', l.raw);
+                if (l.repeat > 1) parts.push(` (×${l.repeat})`);
+                parts.push('\\n');
+            }
+            const blob = new Blob(parts, { type: 'text/plain' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
@@ -1378,24 +2077,36 @@ HTML_PAGE = '''<!DOCTYPE html>
 
         document.querySelector('[data-device="all"]').onclick = () => selectDevice('all');
 
+        // Device tabs share one set of listeners on their container
+        deviceTabs.addEventListener('click', (e) => {
+            const btn = e.target.closest('.tab-btn');
+            if (btn) selectDevice(btn.dataset.device);
+        });
+
+        // Right-click for context menu
+        deviceTabs.addEventListener('contextmenu', (e) => {
+            const btn = e.target.closest('.tab-btn');
+            if (!btn) return;
+            e.preventDefault();
+            showDeviceMenu(btn.dataset.device, e);
+        });
+
         // Level filter buttons
         document.querySelectorAll('.level-filter').forEach(btn => {
             btn.onclick = () => {
                 document.querySelectorAll('.level-filter').forEach(b => b.classList.remove('active'));
                 btn.classList.add('active');
                 minLevel = btn.dataset.level;
+                minLevelPriority = levelPriority[minLevel];
                 refilter();
             };
         });
 
-        // Search
-        let searchTimeout;
+        // Search: keystrokes within a frame share one refilter
         searchInput.oninput = (e) => {
-            clearTimeout(searchTimeout);
-            searchTimeout = setTimeout(() => {
-                searchTerm = e.target.value.toLowerCase();
-                refilter();
-            }, 150);
+            searchTerm = e.target.value.toLowerCase();
+            searchRegex = searchTerm ? new RegExp(`(${escapeRegex(searchTerm)})`, 'gi') : null;
+            scheduleRefilter();
         };
 
         // Keyboard shortcuts
@@ -1414,11 +2125,30 @@ HTML_PAGE = '''<!DOCTYPE html>
             }
         };
 
+        logOutput.addEventListener('scroll', () => {
+            stickToBottom = logOutput.scrollHeight - logOutput.scrollTop - logOutput.clientHeight < ROW_HEIGHT;
+            scheduleRender(false);
+        }, { passive: true });
+
         // Logs per second counter
-        setInterval(() => {
+        function updateLogsPerSec() {
             document.getElementById('logs-per-sec').textContent = logsLastSecond;
             logsLastSecond = 0;
-        }, 1000);
+        }
+        let logsPerSecTimer = setInterval(updateLogsPerSec, 1000);
+
+        // Logs keep buffering into the ring while hidden; painting resumes on return
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden) {
+                clearInterval(logsPerSecTimer);
+                cancelAnimationFrame(frameId);
+                frameId = 0;
+            } else {
+                logsLastSecond = 0;
+                logsPerSecTimer = setInterval(updateLogsPerSec, 1000);
+                if (renderDirty || statsDirty || filterDirty) scheduleFrame();
+            }
+        });
 
         // Start
         connect();
@@ -1427,11 +2157,24 @@ HTML_PAGE = '''<!DOCTYPE html>
 </html>
 '''
 
+# The page never changes while the server runs: encode and compress it
+# once and let browsers revalidate with the ETag instead of downloading it again
+HTML_BYTES = HTML_PAGE.encode('utf-8')
+HTML_GZIP = gzip.compress(HTML_BYTES, compresslevel=9)
+HTML_ETAG = f'"{hashlib.md5(HTML_BYTES).hexdigest()}"'
+
 
 async def on_startup(app):
     """Initialize on startup"""
     await device_manager.load_config()
 
+    # Batch log lines into one WebSocket message per flush
+    device_manager.parse_pool = ProcessPoolExecutor(
+        max_workers=PARSE_WORKERS, initializer=init_parse_worker
+    )
+    device_manager.log_queue = asyncio.Queue()
+    device_manager.flush_task = asyncio.create_task(device_manager.run_log_flusher())
+
     # Auto-connect to known devices
     for device_id in list(device_manager.devices.keys()):
         asyncio.create_task(device_manager.connect_device(device_id))
@@ -1439,6 +2182,13 @@ async def on_startup(app):
 
 async def on_cleanup(app):
     """Clean up on shutdown"""
+    if device_manager.flush_task:
+        device_manager.flush_task.cancel()
+    if device_manager.device_update_task:
+        device_manager.device_update_task.cancel()
+    if device_manager.parse_pool:
+        device_manager.parse_pool.shutdown(wait=False)
+
     # Disconnect all devices
     for device_id in list(device_manager.devices.keys()):
         await device_manager.disconnect_device(device_id)
@@ -1448,6 +2198,9 @@ async def on_cleanup(app):
 
 
 def main():
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     app = web.Application()
     app.router.add_get('/', index_handler)
     app.router.add_get('/ws', websocket_handler)
@@ -1490,7 +2243,8 @@ def main():
 ╚═══════════════════════════════════════════════════════════╝
 """)
 
-    web.run_app(app, host=HOST, port=PORT, print=None)
+    # No per-request access log: nobody reads it and it only costs formatting
+    web.run_app(app, host=HOST, port=PORT, print=None, access_log=None)
 
 
 if __name__ == '__main__':